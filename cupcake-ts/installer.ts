@@ -55,10 +55,19 @@ const OPA_BINARIES: Record<string, BinaryInfo> = {
   },
 };
 
+let cachedCacheDir: string | null = null;
+let cachedPlatformKey: string | null = null;
+
 /**
  * Get the directory for caching OPA binaries
+ *
+ * The directory is only created when a download needs it (see `ensureCacheDir`).
  */
 function getCacheDir(): string {
+  if (cachedCacheDir) {
+    return cachedCacheDir;
+  }
+
   let cacheBase: string;
 
   if (process.platform === 'win32') {
@@ -67,9 +76,16 @@ function getCacheDir(): string {
     cacheBase = process.env.XDG_CACHE_HOME || path.join(os.homedir(), '.cache');
   }
 
-  const cacheDir = path.join(cacheBase, 'cupcake', 'bin');
-  fs.mkdirSync(cacheDir, { recursive: true });
+  cachedCacheDir = path.join(cacheBase, 'cupcake', 'bin');
+  return cachedCacheDir;
+}
 
+/**
+ * Create the cache directory if needed and return it
+ */
+function ensureCacheDir(): string {
+  const cacheDir = getCacheDir();
+  fs.mkdirSync(cacheDir, { recursive: true });
   return cacheDir;
 }
 
@@ -77,6 +93,10 @@ function getCacheDir(): string {
  * Get platform identifier for OPA binary lookup
  */
 function getPlatformKey(): string {
+  if (cachedPlatformKey) {
+    return cachedPlatformKey;
+  }
+
   const platform = process.platform;
   const arch = process.arch;
 
@@ -99,16 +119,20 @@ function getPlatformKey(): string {
     throw new Error(`Unsupported platform: ${platform} ${arch}`);
   }
 
-  return `${normalizedPlatform}-${normalizedArch}`;
+  cachedPlatformKey = `${normalizedPlatform}-${normalizedArch}`;
+  return cachedPlatformKey;
 }
 
+// Read size used when hashing the OPA binary (tens of MB), instead of the 64 KiB stream default
+const HASH_CHUNK_SIZE = 1024 * 1024;
+
 /**
  * Verify the SHA256 checksum of a file
  */
 async function verifyChecksum(filePath: string, expectedSha256: string): Promise<boolean> {
   return new Promise((resolve, reject) => {
     const hash = crypto.createHash('sha256');
-    const stream = fs.createReadStream(filePath);
+    const stream = fs.createReadStream(filePath, { highWaterMark: HASH_CHUNK_SIZE });
 
     stream.on('data', (data) => hash.update(data));
     stream.on('end', () => {
@@ -121,8 +145,13 @@ async function verifyChecksum(filePath: string, expectedSha256: string): Promise
 
 /**
  * Download a file with progress indication
+ *
+ * The SHA256 digest is computed as chunks arrive, so the file does not need
+ * to be read back from disk for verification.
+ *
+ * @returns Hex-encoded SHA256 digest of the downloaded bytes
  */
-async function downloadWithProgress(url: string, destPath: string, expectedSizeMb: number): Promise<void> {
+async function downloadWithProgress(url: string, destPath: string, expectedSizeMb: number): Promise<string> {
   console.log(`Downloading OPA ${OPA_VERSION} (${expectedSizeMb.toFixed(1)} MB)...`);
 
   const fetch = require('node-fetch');
@@ -135,11 +164,13 @@ async function downloadWithProgress(url: string, destPath: string, expectedSizeM
   const totalSize = parseInt(response.headers.get('content-length') || '0', 10);
   let downloaded = 0;
 
+  const hash = crypto.createHash('sha256');
   const fileStream = fs.createWriteStream(destPath);
 
   return new Promise((resolve, reject) => {
     response.body!.on('data', (chunk: Buffer) => {
       downloaded += chunk.length;
+      hash.update(chunk);
       fileStream.write(chunk);
 
       if (totalSize > 0) {
@@ -149,15 +180,19 @@ async function downloadWithProgress(url: string, destPath: string, expectedSizeM
     });
 
     response.body!.on('end', () => {
-      fileStream.end();
-      console.log('\nDownload complete!');
-      resolve();
+      // Wait for buffered writes to land before the caller renames the file
+      fileStream.end(() => {
+        console.log('\nDownload complete!');
+        resolve(hash.digest('hex'));
+      });
     });
 
     response.body!.on('error', (err: Error) => {
       fileStream.close();
       reject(err);
     });
+
+    fileStream.on('error', reject);
   });
 }
 
@@ -190,7 +225,7 @@ export async function downloadOpa(force = false): Promise<string> {
   const { binary: binaryName, sha256: expectedSha256, size_mb: sizeMb } = binaryInfo;
 
   // Determine local path
-  const cacheDir = getCacheDir();
+  const cacheDir = ensureCacheDir();
   let localName = `opa-${OPA_VERSION}`;
   if (process.platform === 'win32') {
     localName += '.exe';
@@ -214,11 +249,11 @@ export async function downloadOpa(force = false): Promise<string> {
   const tempPath = localPath + '.tmp';
 
   try {
-    await downloadWithProgress(url, tempPath, sizeMb);
+    const actualSha256 = await downloadWithProgress(url, tempPath, sizeMb);
 
     // Verify checksum
     console.log('Verifying checksum...');
-    if (!(await verifyChecksum(tempPath, expectedSha256))) {
+    if (actualSha256 !== expectedSha256) {
       throw new Error(
         `Checksum verification failed for ${binaryName}\n` + `This could indicate a corrupted download or security issue.`,
       );
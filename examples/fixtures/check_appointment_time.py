@@ -3,19 +3,21 @@
 import json
 import sys
 import re
-import psycopg2
 from datetime import datetime, timedelta
 
+ID_PATTERN = re.compile(r"id\s*=\s*['\"]?(\d+)['\"]?", re.IGNORECASE)
+PATIENT_NAME_PATTERN = re.compile(r"patient_name\s*=\s*'([^']+)'", re.IGNORECASE)
+
 
 def extract_identifier(sql_command):
     """Extract appointment ID or patient name from SQL."""
     # Try ID first
-    match = re.search(r"id\s*=\s*['\"]?(\d+)['\"]?", sql_command, re.IGNORECASE)
+    match = ID_PATTERN.search(sql_command)
     if match:
         return {"type": "id", "value": int(match.group(1))}
 
     # Try patient name
-    match = re.search(r"patient_name\s*=\s*'([^']+)'", sql_command, re.IGNORECASE)
+    match = PATIENT_NAME_PATTERN.search(sql_command)
     if match:
         return {"type": "patient_name", "value": match.group(1)}
 
@@ -24,6 +26,9 @@ def extract_identifier(sql_command):
 
 def check_appointment_time(identifier):
     """Check if appointment is within 24 hours."""
+    # Imported here so events for other tools don't pay for loading the driver
+    import psycopg2
+
     try:
         conn = psycopg2.connect(
             host="localhost",
@@ -67,19 +72,21 @@ def check_appointment_time(identifier):
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
 
         if input_data.get("tool_name") != "mcp__postgres__execute_sql":
             print(json.dumps({"relevant": False}))
             return
 
-        sql = input_data.get("tool_input", {}).get("sql", "").lower()
+        original_sql = input_data.get("tool_input", {}).get("sql", "")
+        sql = original_sql.lower()
 
         if "update" not in sql or "appointments" not in sql:
             print(json.dumps({"relevant": False}))
             return
 
-        identifier = extract_identifier(input_data.get("tool_input", {}).get("sql", ""))
+        # Extract identifier from original SQL (not lowercased)
+        identifier = extract_identifier(original_sql)
         if not identifier:
             print(json.dumps({"relevant": True, "error": "Could not extract appointment identifier from SQL"}))
             return
@@ -8,19 +8,21 @@ This is the Cursor-specific version that handles:
 import json
 import sys
 import re
-import psycopg2
 from datetime import datetime, timedelta
 
+ID_PATTERN = re.compile(r"id\s*=\s*['\"]?(\d+)['\"]?", re.IGNORECASE)
+PATIENT_NAME_PATTERN = re.compile(r"patient_name\s*=\s*'([^']+)'", re.IGNORECASE)
+
 
 def extract_identifier(sql_command):
     """Extract appointment ID or patient name from SQL."""
     # Try ID first
-    match = re.search(r"id\s*=\s*['\"]?(\d+)['\"]?", sql_command, re.IGNORECASE)
+    match = ID_PATTERN.search(sql_command)
     if match:
         return {"type": "id", "value": int(match.group(1))}
 
     # Try patient name
-    match = re.search(r"patient_name\s*=\s*'([^']+)'", sql_command, re.IGNORECASE)
+    match = PATIENT_NAME_PATTERN.search(sql_command)
     if match:
         return {"type": "patient_name", "value": match.group(1)}
 
@@ -29,6 +31,9 @@ def extract_identifier(sql_command):
 
 def check_appointment_time(identifier):
     """Check if appointment is within 24 hours."""
+    # Imported here so events for other tools don't pay for loading the driver
+    import psycopg2
+
     try:
         conn = psycopg2.connect(
             host="localhost",
@@ -72,7 +77,7 @@ def check_appointment_time(identifier):
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = json.loads(sys.stdin.buffer.read())
 
         # Cursor uses "execute_sql" as tool name (not mcp__postgres__execute_sql)
         if input_data.get("tool_name") != "execute_sql":
@@ -86,14 +91,14 @@ def main():
         else:
             tool_input = tool_input_raw
 
-        sql = tool_input.get("sql", "").lower()
+        original_sql = tool_input.get("sql", "")
+        sql = original_sql.lower()
 
         if "update" not in sql or "appointments" not in sql:
             print(json.dumps({"relevant": False}))
             return
 
         # Extract identifier from original SQL (not lowercased)
-        original_sql = tool_input.get("sql", "")
         identifier = extract_identifier(original_sql)
         if not identifier:
             print(json.dumps({"relevant": True, "error": "Could not extract appointment identifier from SQL"}))
@@ -8,15 +8,40 @@ Supports URL pattern replacement for testing against staging environments.
 """
 
 import argparse
+import base64
+import functools
+import http.client
 import json
 import os
+import random
 import re
+import socket
+import sqlite3
 import sys
+import threading
+import time
 import urllib.error
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import islice, zip_longest
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote, urljoin, urlsplit, urlunsplit
+
+# Markdown links [text](url) and reference-style links [text]: url in one pass
+MARKDOWN_LINK_RE = re.compile(
+    r'\[(?:[^\]]*)\]\((?P<inline>[^)]+)\)'
+    r'|^\[(?:[^\]]+)\]:\s*(?P<ref>\S+)',
+    re.MULTILINE,
+)
+# Plain URLs (http/https) - exclude common trailing punctuation/delimiters
+PLAIN_URL_RE = re.compile(r'(?:https?://[^\s\)<>\[\]{}"\',;]+)')
+# HTML href/src attributes
+HREF_RE = re.compile(r'href=["\'](https?://[^"\']+)["\']', re.IGNORECASE)
+SRC_RE = re.compile(r'src=["\'](https?://[^"\']+)["\']', re.IGNORECASE)
+# Local addresses and placeholder domains that are never checked (matched on the lowercased URL)
+UNCHECKED_HOSTS_RE = re.compile(r'localhost|127\.0\.0\.1|0\.0\.0\.0|example\.com|example\.org')
 
 
 class Config:
@@ -27,7 +52,12 @@ class Config:
         self.timeout = args.timeout
         self.verbose = args.verbose
         self.workers = args.workers
+        self.max_per_host = args.max_per_host
+        self.retries = args.retries
+        self.cache_path = self._parse_cache_path(args)
+        self.cache_ttl = args.cache_ttl
         self.replacements = self._parse_replacements(args)
+        self.replacement_pattern = self._compile_replacements(self.replacements)
         self.skip_domains = self._parse_skip_domains(args)
         self.skip_urls = self._parse_skip_urls(args)
         self.skip_files = self._parse_skip_files(args)
@@ -49,6 +79,11 @@ class Config:
         
         return patterns
     
+    def _parse_cache_path(self, args: argparse.Namespace) -> Optional[Path]:
+        """Parse the URL status cache location from env var and CLI args."""
+        cache_path = args.cache or os.environ.get('URL_CHECK_CACHE', '').strip()
+        return Path(cache_path) if cache_path else None
+    
     def _parse_replacements(self, args: argparse.Namespace) -> Dict[str, str]:
         """Parse URL replacements from env var and CLI args."""
         replacements = {}
@@ -70,6 +105,14 @@ class Config:
         
         return replacements
     
+    @staticmethod
+    def _compile_replacements(replacements: Dict[str, str]) -> Optional[re.Pattern]:
+        """Compile replacement keys into one alternation, longest first so it takes precedence."""
+        keys = sorted((k for k in replacements if k), key=len, reverse=True)
+        if not keys:
+            return None
+        return re.compile('|'.join(re.escape(k) for k in keys))
+    
     def _parse_skip_domains(self, args: argparse.Namespace) -> Set[str]:
         """Parse skip domains from env var and CLI args."""
         skip_domains = set()
@@ -127,6 +170,10 @@ class Config:
             print(f"Skipping files: {', '.join(sorted(self.skip_files))}")
             print()
         
+        if self.cache_path:
+            print(f"Using URL status cache: {self.cache_path} (TTL {self.cache_ttl}h)")
+            print()
+        
         print(f"Markdown patterns: {', '.join(self.markdown_patterns)}")
         print(f"HTML patterns: {', '.join(self.html_patterns)}")
         if self.file_patterns:
@@ -142,101 +189,164 @@ class URLExtractor:
         'dist', 'build', '.venv', 'venv',
     ]
     
+    # Threads used to read matched files; reads are I/O-bound and release the GIL
+    READ_WORKERS = 16
+    # Files read ahead of URL extraction, bounding how much content is held in memory
+    READ_AHEAD = READ_WORKERS * 4
+    
     @staticmethod
     def extract_from_markdown(content: str) -> List[str]:
         """Extract URLs from markdown content."""
-        urls = []
-        
-        # Markdown links: [text](url)
-        markdown_links = re.findall(r'\[(?:[^\]]*)\]\(([^)]+)\)', content)
-        urls.extend(markdown_links)
-        
-        # Reference-style links: [text]: url
-        reference_links = re.findall(r'^\[(?:[^\]]+)\]:\s*(\S+)', content, re.MULTILINE)
-        urls.extend(reference_links)
-        
-        # Plain URLs (http/https) - exclude common trailing punctuation/delimiters
-        plain_urls = re.findall(r'(?:https?://[^\s\)<>\[\]{}"\',;]+)', content)
-        urls.extend(plain_urls)
-        
+        urls = [inline or ref for inline, ref in MARKDOWN_LINK_RE.findall(content)]
+        # Plain URLs get their own pass: they also pick up links inside
+        # markdown link text and targets that carry a title
+        urls.extend(PLAIN_URL_RE.findall(content))
         return urls
     
     @staticmethod
     def extract_from_html(content: str) -> List[str]:
         """Extract URLs from HTML content."""
-        urls = []
+        urls = HREF_RE.findall(content)
+        urls.extend(SRC_RE.findall(content))
+        return urls
+    
+    @classmethod
+    def iter_files(cls, directory: str) -> Iterator[os.DirEntry]:
+        """Yield file entries below directory, skipping excluded directories.
         
-        # href attributes
-        href_urls = re.findall(r'href=["\'](https?://[^"\']+)["\']', content, re.IGNORECASE)
-        urls.extend(href_urls)
+        Mirrors os.walk ordering (a directory's files before its
+        subdirectories) and does not follow directory symlinks.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
         
-        # src attributes
-        src_urls = re.findall(r'src=["\'](https?://[^"\']+)["\']', content, re.IGNORECASE)
-        urls.extend(src_urls)
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            
+            if not is_dir:
+                yield entry
+            elif entry.name not in cls.EXCLUDE_PATTERNS and not entry.is_symlink():
+                subdirs.append(entry.path)
         
-        return urls
+        for subdir in subdirs:
+            yield from cls.iter_files(subdir)
+    
+    @staticmethod
+    def read_file(file_path: str) -> Optional[str]:
+        """Read a file for URL extraction, returning None if it cannot be read."""
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except Exception as e:
+            print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
+            return None
+        
+        # Only http(s) URLs are ever checked, so files without one
+        # skip decoding and regex extraction entirely
+        return raw.decode('utf-8', errors='ignore') if b'http' in raw else ''
     
     @classmethod
-    def scan_directory(cls, root_dir: Path, skip_files: Set[str], markdown_patterns: List[str], html_patterns: List[str], file_patterns: List[str]) -> List[Tuple[Path, str, str]]:
-        """Recursively scan directory for markdown and HTML files.
+    def find_files(cls, root_dir: Path, skip_files: Set[str], markdown_patterns: List[str], html_patterns: List[str], file_patterns: List[str]) -> List[Tuple[str, str]]:
+        """Recursively find markdown, HTML and other matching files.
         
         Returns:
-            List of (file_path, content, file_type) tuples where file_type is 'markdown', 'html', or 'file'
+            List of (file_path, file_type) tuples where file_type is 'markdown', 'html', or 'file'
         """
-        files = []
-        all_patterns = markdown_patterns + html_patterns + file_patterns
+        candidates: List[Tuple[str, str]] = []
+        markdown_suffixes = tuple(markdown_patterns)
+        html_suffixes = tuple(html_patterns)
+        file_suffixes = tuple(file_patterns)
         
-        for root, dirs, filenames in os.walk(root_dir):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d not in cls.EXCLUDE_PATTERNS]
+        for entry in cls.iter_files(str(root_dir)):
+            filename = entry.name
             
-            for filename in filenames:
-                # Check if file matches any pattern
-                matches = False
-                file_type = None
-                
-                for pattern in markdown_patterns:
-                    if filename.endswith(pattern):
-                        matches = True
-                        file_type = 'markdown'
-                        break
-                
-                if not matches:
-                    for pattern in html_patterns:
-                        if filename.endswith(pattern):
-                            matches = True
-                            file_type = 'html'
-                            break
-                
-                if not matches:
-                    for pattern in file_patterns:
-                        if filename.endswith(pattern):
-                            matches = True
-                            file_type = 'file'
-                            break
+            # Check if file matches any pattern
+            if filename.endswith(markdown_suffixes):
+                file_type = 'markdown'
+            elif filename.endswith(html_suffixes):
+                file_type = 'html'
+            elif filename.endswith(file_suffixes):
+                file_type = 'file'
+            else:
+                continue
+            
+            # Check if file should be skipped
+            if skip_files and filename in skip_files:
+                continue
+            
+            candidates.append((entry.path, file_type))
+        
+        return candidates
+    
+    @classmethod
+    def read_files(cls, candidates: List[Tuple[str, str]]) -> Iterator[Tuple[Path, str, str]]:
+        """Read files concurrently, yielding them in order as they are needed.
+        
+        At most READ_AHEAD files are in flight, so only a bounded amount of
+        content is held in memory regardless of the size of the tree.
+        
+        Yields:
+            (file_path, content, file_type) tuples; unreadable files are skipped
+        """
+        remaining = iter(candidates)
+        pending: Deque[Tuple[str, str, Future]] = deque()
+        
+        with ThreadPoolExecutor(max_workers=cls.READ_WORKERS) as executor:
+            def submit(candidate: Tuple[str, str]):
+                file_path, file_type = candidate
+                pending.append((file_path, file_type, executor.submit(cls.read_file, file_path)))
+            
+            for candidate in islice(remaining, cls.READ_AHEAD):
+                submit(candidate)
+            
+            while pending:
+                file_path, file_type, future = pending.popleft()
+                next_candidate = next(remaining, None)
+                if next_candidate is not None:
+                    submit(next_candidate)
                 
-                if matches:
-                    file_path = Path(root) / filename
-                    
-                    # Check if file should be skipped
-                    if skip_files and filename in skip_files:
-                        continue
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        files.append((file_path, content, file_type))
-                    except Exception as e:
-                        print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
-        
-        return files
+                content = future.result()
+                if content is not None:
+                    yield (Path(file_path), content, file_type)
 
 
 class URLChecker:
     """Check URLs for validity and accessibility."""
     
+    # HTTP statuses that usually mean "try again later" rather than a broken link
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    MAX_RETRY_DELAY = 10.0
+    REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+    MAX_REDIRECTS = 10
+    # Largest response body read just to keep a connection reusable
+    MAX_DRAIN_BYTES = 64 * 1024
+    USER_AGENT = 'Mozilla/5.0 (compatible; URLChecker/1.0)'
+    
     def __init__(self, config: Config):
         self.config = config
+        # Keep-alive connections, one per (scheme, host) in each worker thread
+        self._local = threading.local()
+        # Every worker's connection dict, so close() can reach them from the main thread
+        self._thread_connections: List[Dict[Tuple[str, str], http.client.HTTPConnection]] = []
+        self._connections_lock = threading.Lock()
+        # HTTP(S)_PROXY / NO_PROXY from the environment, as urllib would use them
+        self._proxies = urllib.request.getproxies()
+        self._proxy_by_host: Dict[Tuple[str, str], Optional[Tuple[str, Dict[str, str]]]] = {}
+        # Subdomains of a skipped domain are skipped too
+        self.skip_domain_suffixes = tuple('.' + domain for domain in config.skip_domains)
+    
+    @staticmethod
+    def enable_dns_cache():
+        """Resolve each host once per run instead of once per request."""
+        if not hasattr(socket.getaddrinfo, 'cache_info'):
+            socket.getaddrinfo = functools.lru_cache(maxsize=None)(socket.getaddrinfo)
     
     @staticmethod
     def get_domain(url: str) -> str:
@@ -253,18 +363,14 @@ class URLChecker:
         if not url.startswith(('http://', 'https://')):
             return False
         
-        # Filter out localhost and internal IPs
-        if any(pattern in url.lower() for pattern in ['localhost', '127.0.0.1', '0.0.0.0']):
-            return False
-        
-        # Filter out example/placeholder domains
-        if any(domain in url.lower() for domain in ['example.com', 'example.org']):
+        # Filter out localhost, internal IPs and example/placeholder domains
+        if UNCHECKED_HOSTS_RE.search(url.lower()):
             return False
         
-        # Filter out skip domains
+        # Filter out skip domains (exact host or any subdomain of it)
         if self.config.skip_domains:
             domain = self.get_domain(url)
-            if any(skip in domain for skip in self.config.skip_domains):
+            if domain in self.config.skip_domains or domain.endswith(self.skip_domain_suffixes):
                 return False
         
         # Filter out skip URLs (exact match or substring)
@@ -274,30 +380,287 @@ class URLChecker:
         
         return True
     
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Normalize a URL so trivially different spellings are checked once.
+        
+        Lowercases the scheme and host, drops default ports and strips the
+        fragment, none of which change the request that is sent.
+        """
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
+        default_port = {'http': ':80', 'https': ':443'}.get(scheme)
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc[:-len(default_port)]
+        
+        return urlunsplit((scheme, netloc, parts.path, parts.query, ''))
+    
     def apply_replacements(self, url: str) -> str:
-        """Apply URL pattern replacements."""
-        for from_pattern, to_pattern in self.config.replacements.items():
-            url = url.replace(from_pattern, to_pattern)
-        return url
+        """Apply URL pattern replacements in a single pass."""
+        pattern = self.config.replacement_pattern
+        if pattern is None:
+            return url
+        return pattern.sub(lambda m: self.config.replacements[m.group(0)], url)
+    
+    def _proxy_for(self, scheme: str, netloc: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """Return the proxy address and request headers to reach a host through, if any."""
+        key = (scheme, netloc)
+        if key in self._proxy_by_host:
+            return self._proxy_by_host[key]
+        
+        proxy = self._proxies.get(scheme)
+        result = None
+        if proxy and not urllib.request.proxy_bypass(netloc):
+            if '://' not in proxy:
+                proxy = 'http://' + proxy
+            parts = urlsplit(proxy)
+            headers = {}
+            if parts.username is not None:
+                credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+                headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')
+            result = (parts.netloc.rpartition('@')[2], headers)
+        
+        self._proxy_by_host[key] = result
+        return result
+    
+    def _get_connection(self, scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return this thread's connection to a host and whether it is being reused."""
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+            with self._connections_lock:
+                self._thread_connections.append(connections)
+        
+        conn = connections.get((scheme, netloc))
+        if conn is not None:
+            return conn, True
+        
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        proxy = self._proxy_for(scheme, netloc)
+        if proxy is None:
+            conn = conn_class(netloc, timeout=self.config.timeout)
+        else:
+            proxy_netloc, proxy_headers = proxy
+            conn = conn_class(proxy_netloc, timeout=self.config.timeout)
+            if scheme == 'https':
+                # HTTPS goes through a CONNECT tunnel; plain HTTP is forwarded per request in _send
+                conn.set_tunnel(netloc, headers=proxy_headers)
+        connections[(scheme, netloc)] = conn
+        return conn, False
+    
+    def _drop_connection(self, scheme: str, netloc: str):
+        """Close and forget this thread's connection to a host."""
+        conn = self._local.connections.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+    
+    def _send(self, scheme: str, netloc: str, method: str, target: str) -> http.client.HTTPResponse:
+        """Send a request over a keep-alive connection, reconnecting once if it went stale."""
+        headers = {'User-Agent': self.USER_AGENT}
+        proxy = self._proxy_for(scheme, netloc)
+        if proxy is not None and scheme == 'http':
+            target = f"http://{netloc}{target}"
+            headers.update(proxy[1])
+        
+        while True:
+            conn, reused = self._get_connection(scheme, netloc)
+            try:
+                conn.request(method, target, headers=headers)
+                return conn.getresponse()
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine, http.client.ImproperConnectionState,
+                    BrokenPipeError, ConnectionResetError) as e:
+                self._drop_connection(scheme, netloc)
+                if not reused:
+                    raise urllib.error.URLError(e)
+            except http.client.InvalidURL:
+                # A malformed URL will not succeed on retry, so don't report it as a URLError
+                self._drop_connection(scheme, netloc)
+                raise
+            except (OSError, http.client.HTTPException) as e:
+                self._drop_connection(scheme, netloc)
+                raise urllib.error.URLError(e)
+    
+    def _request_status(self, url: str, method: str) -> int:
+        """Issue a request, following redirects, and return the final status code.
+        
+        Raises:
+            urllib.error.HTTPError: for 4xx/5xx responses, too many redirects
+                or a redirect to a URL that can't be checked
+            urllib.error.URLError: for connection-level failures
+            ValueError: for a URL with no host, an unsupported scheme or a bad port
+        """
+        for hop in range(self.MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            try:
+                valid = scheme in ('http', 'https') and bool(parts.hostname) and parts.port != 0
+            except ValueError:
+                # Non-numeric or out-of-range port
+                valid = False
+            
+            # Neither case succeeds on retry, so neither is raised as a URLError
+            if not valid:
+                if hop:
+                    raise urllib.error.HTTPError(url, status, f"Redirection to {url} is not allowed", response.headers, None)
+                raise ValueError(f"invalid URL: {url}")
+            
+            target = parts.path or '/'
+            if parts.query:
+                target += '?' + parts.query
+            
+            response = self._send(scheme, parts.netloc, method, target)
+            status = response.status
+            location = response.getheader('Location')
+            
+            # Drain empty or small bodies (HEAD, redirects, error pages) so the
+            # connection stays reusable; for anything larger, reconnecting is
+            # cheaper than downloading a body nobody reads
+            if not response.will_close and response.length is not None and response.length <= self.MAX_DRAIN_BYTES:
+                try:
+                    response.read()
+                except Exception as e:
+                    # A half-read response leaves the connection unusable
+                    self._drop_connection(scheme, parts.netloc)
+                    raise urllib.error.URLError(e)
+            else:
+                response.close()
+                self._drop_connection(scheme, parts.netloc)
+            
+            if status in self.REDIRECT_STATUS_CODES and location:
+                url = urljoin(url, location)
+                continue
+            if status >= 400:
+                raise urllib.error.HTTPError(url, status, response.reason, response.headers, None)
+            return status
+        
+        raise urllib.error.HTTPError(url, status, "Too many redirects", response.headers, None)
+    
+    def close(self):
+        """Close all keep-alive connections opened by any worker thread."""
+        with self._connections_lock:
+            for connections in self._thread_connections:
+                while connections:
+                    connections.popitem()[1].close()
+    
+    def _fetch_status(self, url: str, last_attempt: bool = True) -> int:
+        """Fetch the status of a URL, trying HEAD before falling back to GET.
+        
+        Any HTTP error on HEAD is confirmed with a GET before the URL is
+        reported, since some servers reject or mishandle HEAD. Throttling and
+        server errors on earlier attempts are left to check_url's backoff
+        instead, so a struggling host is not hit again straight away.
+        """
+        try:
+            return self._request_status(url, 'HEAD')
+        except urllib.error.HTTPError as e:
+            if e.code in self.RETRY_STATUS_CODES and not last_attempt:
+                raise
+            return self._request_status(url, 'GET')
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """Jittered exponential backoff, honouring Retry-After when given in seconds."""
+        delay = 0.5 * 2 ** attempt + random.random() * 0.25
+        
+        if isinstance(error, urllib.error.HTTPError) and error.headers:
+            retry_after = (error.headers.get('Retry-After') or '').strip()
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+        
+        return min(delay, self.MAX_RETRY_DELAY)
     
     def check_url(self, url: str) -> Tuple[bool, int, str]:
-        """Check if a URL resolves successfully."""
-        try:
-            req = urllib.request.Request(
-                url,
-                headers={'User-Agent': 'Mozilla/5.0 (compatible; URLChecker/1.0)'}
-            )
+        """Check if a URL resolves successfully.
+        
+        Connection failures, timeouts and retryable HTTP statuses are retried
+        with backoff so transient errors are not reported as broken links.
+        """
+        attempts = max(self.config.retries, 0) + 1
+        
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
             
-            with urllib.request.urlopen(req, timeout=self.config.timeout) as response:
-                status = response.getcode()
+            try:
+                status = self._fetch_status(url, last_attempt)
                 return (200 <= status < 400, status, "")
-        
-        except urllib.error.HTTPError as e:
-            return (False, e.code, f"HTTP {e.code}: {e.reason}")
-        except urllib.error.URLError as e:
-            return (False, 0, f"URL Error: {e.reason}")
-        except Exception as e:
-            return (False, 0, f"Error: {str(e)}")
+            
+            except urllib.error.HTTPError as e:
+                if last_attempt or e.code not in self.RETRY_STATUS_CODES:
+                    return (False, e.code, f"HTTP {e.code}: {e.reason}")
+                error: Exception = e
+            except urllib.error.URLError as e:
+                if last_attempt:
+                    return (False, 0, f"URL Error: {e.reason}")
+                error = e
+            except (TimeoutError, ConnectionError) as e:
+                if last_attempt:
+                    return (False, 0, f"Error: {str(e)}")
+                error = e
+            except Exception as e:
+                return (False, 0, f"Error: {str(e)}")
+            
+            time.sleep(self._retry_delay(attempt, error))
+
+
+class URLStatusCache:
+    """On-disk cache of successful URL checks, shared across runs.
+    
+    Only successes are reused; a URL that failed is always checked again.
+    """
+    
+    # URLs per SELECT, kept under SQLite's bound-parameter limit
+    LOOKUP_BATCH_SIZE = 500
+    
+    def __init__(self, path: Path, ttl_hours: float):
+        self.ttl_seconds = ttl_hours * 3600
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS url_status ('
+            'url TEXT PRIMARY KEY, status INTEGER NOT NULL, checked_at REAL NOT NULL)'
+        )
+        # Expired entries are never reused, so drop them instead of letting the table grow
+        self.conn.execute('DELETE FROM url_status WHERE checked_at < ?', (self._cutoff(),))
+    
+    def _cutoff(self) -> float:
+        """Oldest check time that is still fresh."""
+        return time.time() - self.ttl_seconds
+    
+    def fresh_urls(self, urls: Set[str]) -> Set[str]:
+        """Return the URLs that succeeded within the TTL."""
+        cutoff = self._cutoff()
+        fresh: Set[str] = set()
+        remaining = iter(urls)
+        while True:
+            batch = list(islice(remaining, self.LOOKUP_BATCH_SIZE))
+            if not batch:
+                return fresh
+            placeholders = ','.join('?' * len(batch))
+            rows = self.conn.execute(
+                f'SELECT url FROM url_status WHERE checked_at >= ? AND url IN ({placeholders})',
+                (cutoff, *batch)
+            )
+            fresh.update(url for (url,) in rows)
+    
+    def record(self, url: str, success: bool, status_code: int):
+        """Store a successful check, or drop any stale entry for a failed one."""
+        if success:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO url_status (url, status, checked_at) VALUES (?, ?, ?)',
+                (url, status_code, time.time())
+            )
+        else:
+            self.conn.execute('DELETE FROM url_status WHERE url = ?', (url,))
+    
+    def close(self):
+        """Persist recorded results."""
+        self.conn.commit()
+        self.conn.close()
 
 
 class URLCheckRunner:
@@ -307,8 +670,9 @@ class URLCheckRunner:
         self.config = config
         self.checker = URLChecker(config)
         self.extractor = URLExtractor()
+        self.cache: Optional[URLStatusCache] = None
     
-    def extract_all_urls(self, files: List[Tuple[Path, str, str]]) -> Tuple[Set[str], Dict[str, List[Path]]]:
+    def extract_all_urls(self, files: Iterable[Tuple[Path, str, str]]) -> Tuple[Set[str], Dict[str, List[Path]]]:
         """Extract all URLs from files."""
         all_urls: Set[str] = set()
         url_sources: Dict[str, List[Path]] = {}
@@ -325,7 +689,7 @@ class URLCheckRunner:
             
             for url in urls:
                 if self.checker.is_valid_url(url):
-                    replaced_url = self.checker.apply_replacements(url)
+                    replaced_url = self.checker.normalize_url(self.checker.apply_replacements(url))
                     all_urls.add(replaced_url)
                     
                     if replaced_url not in url_sources:
@@ -339,10 +703,21 @@ class URLCheckRunner:
         broken_links = []
         checked = 0
         total = len(urls)
-        urls_list = sorted(urls)
+        
+        # Interleave hosts so consecutive submissions hit different servers,
+        # and cap in-flight requests per host to avoid self-inflicted 429s
+        urls_by_host: Dict[str, List[str]] = defaultdict(list)
+        for url in sorted(urls):
+            urls_by_host[self.checker.get_domain(url)].append(url)
+        urls_list = [url for batch in zip_longest(*urls_by_host.values()) for url in batch if url is not None]
+        host_limits = {
+            host: threading.BoundedSemaphore(self.config.max_per_host)
+            for host in urls_by_host
+        }
         
         def check_single_url(url: str) -> Tuple[str, bool, int, str]:
-            success, status_code, error_msg = self.checker.check_url(url)
+            with host_limits[self.checker.get_domain(url)]:
+                success, status_code, error_msg = self.checker.check_url(url)
             return (url, success, status_code, error_msg)
         
         with ThreadPoolExecutor(max_workers=self.config.workers) as executor:
@@ -352,6 +727,9 @@ class URLCheckRunner:
                 checked += 1
                 url, success, status_code, error_msg = future.result()
                 
+                if self.cache:
+                    self.cache.record(url, success, status_code)
+                
                 if not self.config.verbose:
                     print(f"Checking URLs... {checked}/{total}", end='\r')
                 
@@ -364,7 +742,7 @@ class URLCheckRunner:
         
         return broken_links
     
-    def print_results(self, broken_links: List[Tuple[str, int, str, List[Path]]], total_urls: int, total_files: int):
+    def print_results(self, broken_links: List[Tuple[str, int, str, List[Path]]], checked_urls: int, total_files: int, cached_urls: int = 0):
         """Print final results."""
         print()
         print()
@@ -391,7 +769,9 @@ class URLCheckRunner:
             print("=" * 80)
             print("✓ ALL LINKS OK")
             print("=" * 80)
-            print(f"Checked {total_urls} unique URLs across {total_files} files")
+            print(f"Checked {checked_urls} unique URLs across {total_files} files")
+            if cached_urls:
+                print(f"Skipped {cached_urls} more URLs that passed within the last {self.config.cache_ttl}h")
             return 0
     
     def run(self) -> int:
@@ -403,23 +783,54 @@ class URLCheckRunner:
         self.config.print_config()
         
         print(f"Scanning {self.config.directory} for files...")
-        files = self.extractor.scan_directory(
+        candidates = self.extractor.find_files(
             self.config.directory,
             self.config.skip_files,
             self.config.markdown_patterns,
             self.config.html_patterns,
             self.config.file_patterns
         )
-        print(f"Found {len(files)} files to scan")
+        print(f"Found {len(candidates)} files to scan")
         print()
         
-        all_urls, url_sources = self.extract_all_urls(files)
+        # Files are read and scanned one at a time, so their contents are not all kept in memory
+        all_urls, url_sources = self.extract_all_urls(self.extractor.read_files(candidates))
         print(f"Found {len(all_urls)} unique URLs to check (using {self.config.workers} workers)")
         print()
         
-        broken_links = self.check_urls_parallel(all_urls, url_sources)
+        urls_to_check = all_urls
+        if self.config.cache_path:
+            try:
+                self.cache = URLStatusCache(self.config.cache_path, self.config.cache_ttl)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Error: Could not open URL cache {self.config.cache_path}: {e}", file=sys.stderr)
+                return 1
+            cached_urls = self.cache.fresh_urls(all_urls)
+            if cached_urls:
+                print(f"Skipping {len(cached_urls)} URLs that passed within the last {self.config.cache_ttl}h")
+                print()
+            urls_to_check = all_urls - cached_urls
+        
+        self.checker.enable_dns_cache()
+        try:
+            broken_links = self.check_urls_parallel(urls_to_check, url_sources)
+        finally:
+            self.checker.close()
+            if self.cache:
+                self.cache.close()
         
-        return self.print_results(broken_links, len(all_urls), len(files))
+        return self.print_results(broken_links, len(urls_to_check), len(candidates), len(all_urls) - len(urls_to_check))
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -464,6 +875,34 @@ def main():
         help='Number of parallel workers for URL checks (default: 8)'
     )
     
+    parser.add_argument(
+        '--max-per-host',
+        type=positive_int,
+        default=4,
+        help='Maximum concurrent requests to a single host (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=2,
+        help='Retries for connection errors, timeouts and 429/5xx responses (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        type=str,
+        default=None,
+        help='SQLite file for caching successful URL checks across runs (env: URL_CHECK_CACHE)'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=24,
+        help='Hours a cached successful check stays valid (default: 24)'
+    )
+    
     parser.add_argument(
         '--skip-domains',
         type=str,